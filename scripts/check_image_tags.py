@@ -10,10 +10,27 @@ If no file is specified, presents an interactive list of inventory files.
 """
 
 import argparse
+import asyncio
+import hashlib
+import io
+import json
+import os
 import re
+import shlex
 import subprocess
 import sys
+import tempfile
+import time
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urljoin
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
 
 # ANSI color codes
 GREEN = "\033[92m"
@@ -23,6 +40,36 @@ CYAN = "\033[96m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
+# Pattern to match lines like:
+# variable_image_tag: "value"  # skopeo list-tags ... | jq ...
+# variable_image_tag: value  # skopeo list-tags ... | jq ...
+# variable_image_tag: value  # skopeo list-tags ... | jq ...  # noupdate
+IMAGE_TAG_LINE_RE = re.compile(
+    rb"[ \t]*(\w+_image_tag):[ \t]*"  # Variable name ending in _image_tag
+    rb'["\']?([^"\'#\s]+)["\']?[ \t]*'  # Value (quoted or unquoted)
+    rb"#[ \t]*(skopeo[ \t]+list-tags[ \t]+.+)$"  # Comment with skopeo command
+)
+
+# Trailing comment that marks a tag as pinned, e.g. "# noupdate" or "#noupdate"
+NOUPDATE_MARKER_RE = re.compile(rb"[ \t]+#[ \t]*noupdate$")
+
+# Tag lists from previous runs, keyed by a hash of the skopeo command
+CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "homelab"
+    / "skopeo-tags.json"
+)
+
+# Anonymous registry bearer tokens, keyed by (registry host, repository)
+_registry_tokens = {}
+
+# Number of most recent tags kept in each result
+RECENT_TAG_COUNT = 10
+
+# Sequences of digits separated by dots, dashes, or underscores
+VERSION_RE = re.compile(r"^(\d+(?:[.\-_]\d+)*)")
+VERSION_SEPARATOR_RE = re.compile(r"[.\-_]")
+
 
 def parse_image_tag_lines(file_path: Path) -> list[dict]:
     """
@@ -33,61 +80,372 @@ def parse_image_tag_lines(file_path: Path) -> list[dict]:
     - current_value: the current tag value
     - skopeo_command: the full skopeo | jq command from the comment
     - line_number: 1-based line number in the file
+    - pinned: True if the line has a trailing "# noupdate" marker
     """
     results = []
+    buf = file_path.read_bytes()
+
+    # Only lines containing the skopeo subcommand can match, so jump between
+    # them with bytes.find and run the pattern on those lines alone
+    line_number = 1
+    counted_to = 0
+    index = buf.find(b"list-tags")
+    while index != -1:
+        line_start = buf.rfind(b"\n", 0, index) + 1
+        line_end = buf.find(b"\n", index)
+        if line_end == -1:
+            line_end = len(buf)
+
+        match = IMAGE_TAG_LINE_RE.match(buf, line_start, line_end)
+        if match:
+            line_number += buf.count(b"\n", counted_to, line_start)
+            counted_to = line_start
+
+            variable, current_value, skopeo_command = match.groups()
+            skopeo_command = skopeo_command.rstrip()
+
+            # A trailing "# noupdate" marker pins the tag; keep it out of the command
+            marker = NOUPDATE_MARKER_RE.search(skopeo_command)
+            pinned = marker is not None
+            if pinned:
+                skopeo_command = skopeo_command[: marker.start()]
 
-    # Pattern to match lines like:
-    # variable_image_tag: "value"  # skopeo list-tags ... | jq ...
-    # variable_image_tag: value  # skopeo list-tags ... | jq ...
-    pattern = re.compile(
-        r"^(\w+_image_tag):\s*"  # Variable name ending in _image_tag
-        r'["\']?([^"\'#\s]+)["\']?\s*'  # Value (quoted or unquoted)
-        r"#\s*(skopeo\s+list-tags\s+.+)$"  # Comment with skopeo command
-    )
+            results.append(
+                {
+                    "variable": variable.decode(),
+                    "current_value": current_value.decode(),
+                    "skopeo_command": skopeo_command.decode(),
+                    "line_number": line_number,
+                    "pinned": pinned,
+                }
+            )
 
-    with open(file_path, "r") as f:
-        for line_number, line in enumerate(f, 1):
-            match = pattern.match(line.strip())
-            if match:
-                results.append(
-                    {
-                        "variable": match.group(1),
-                        "current_value": match.group(2),
-                        "skopeo_command": match.group(3),
-                        "line_number": line_number,
-                    }
-                )
+        index = buf.find(b"list-tags", line_end)
 
     return results
 
 
-def run_skopeo_command(command: str, timeout: int = 30) -> list[str] | None:
+def split_pipeline(command: str) -> list[list[str]]:
+    """
+    Split a shell pipeline into the argv list for each of its commands.
+
+    Pipes inside quoted arguments (e.g. in a jq filter) are left alone.
+    """
+    lexer = shlex.shlex(command, posix=True, punctuation_chars="|")
+    lexer.whitespace_split = True
+
+    stages = [[]]
+    for token in lexer:
+        if token == "|":
+            stages.append([])
+        else:
+            stages[-1].append(token)
+
+    if any(not stage for stage in stages):
+        raise ValueError(f"Invalid pipeline: {command}")
+
+    return stages
+
+
+def load_tag_cache(cache_file: Path) -> dict:
+    """
+    Load the tag cache from disk.
+
+    Returns an empty cache if the file is missing or unreadable. Malformed
+    entries are dropped so they are treated as cache misses.
+    """
+    try:
+        with open(cache_file, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(cache, dict):
+        return {}
+
+    return {key: entry for key, entry in cache.items() if is_valid_cache_entry(entry)}
+
+
+def is_valid_cache_entry(entry) -> bool:
+    """Check that a cache entry looks like {"timestamp": number, "tags": [str, ...]}."""
+    if not isinstance(entry, dict):
+        return False
+
+    timestamp = entry.get("timestamp")
+    tags = entry.get("tags")
+    return (
+        isinstance(timestamp, (int, float))
+        and not isinstance(timestamp, bool)
+        and isinstance(tags, list)
+        and all(isinstance(tag, str) for tag in tags)
+    )
+
+
+def save_tag_cache(cache_file: Path, cache: dict, cache_ttl: int) -> None:
+    """
+    Atomically write the tag cache to disk, ignoring any errors.
+
+    Entries older than cache_ttl seconds are dropped so stale commands don't
+    accumulate in the file.
+    """
+    now = time.time()
+    cache = {
+        key: entry
+        for key, entry in cache.items()
+        if now - entry["timestamp"] < cache_ttl
+    }
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_file.parent, prefix=f".{cache_file.name}.", delete=False
+        ) as f:
+            json.dump(cache, f)
+        os.replace(f.name, cache_file)
+    except OSError:
+        pass
+
+
+async def run_skopeo_command(
+    command: str,
+    timeout: int = 30,
+    cache: dict | None = None,
+    cache_ttl: int = 0,
+    session=None,
+) -> list[str] | None:
     """
     Run a skopeo command and return the list of tags.
 
+    If a cache is given, tags fetched less than cache_ttl seconds ago are
+    returned without running the command, and fresh results are stored in it.
+
+    If a requests session is given, the tag list is fetched straight from the
+    registry API instead of running skopeo, falling back to skopeo on failure.
+
     Returns None if the command fails.
     """
+    if cache is None:
+        return await fetch_tags(command, timeout=timeout, session=session)
+
+    key = hashlib.sha256(command.encode()).hexdigest()
+    entry = cache.get(key)
+    if entry and time.time() - entry.get("timestamp", 0) < cache_ttl:
+        return entry["tags"]
+
+    tags = await fetch_tags(command, timeout=timeout, session=session)
+    if tags is not None:
+        cache[key] = {"timestamp": time.time(), "tags": tags}
+
+    return tags
+
+
+async def fetch_tags(command: str, timeout: int = 30, session=None) -> list[str] | None:
+    """
+    Fetch the tags for a skopeo command, natively if a session is given.
+
+    Returns None if the command fails.
+    """
+    try:
+        stages = split_pipeline(command)
+    except ValueError:
+        return None
+
+    if session is not None:
+        tags = await fetch_tags_native(session, stages, timeout=timeout)
+        if tags is not None:
+            return tags
+
+    return await run_pipeline(stages, timeout=timeout)
+
+
+def parse_image_reference(reference: str) -> tuple[str, str, str]:
+    """
+    Split an image reference into its registry, registry API host and repository.
+
+    Follows the same defaults as skopeo, e.g.:
+    - "ghcr.io/goauthentik/server" -> ("ghcr.io", "ghcr.io", "goauthentik/server")
+    - "docker.io/library/postgres" -> ("docker.io", "registry-1.docker.io", "library/postgres")
+    - "postgres" -> ("docker.io", "registry-1.docker.io", "library/postgres")
+    """
+    first, _, rest = reference.partition("/")
+    if rest and ("." in first or ":" in first or first == "localhost"):
+        registry, repository = first, rest
+    else:
+        registry, repository = "docker.io", reference
+
+    if registry in ("docker.io", "index.docker.io"):
+        registry = "docker.io"
+        if "/" not in repository:
+            repository = f"library/{repository}"
+        return registry, "registry-1.docker.io", repository
+
+    return registry, registry, repository
+
+
+def request_registry_token(session, challenge: str, timeout: int) -> str:
+    """Request an anonymous bearer token for a registry WWW-Authenticate challenge."""
+    scheme, _, params = challenge.partition(" ")
+    if scheme.lower() != "bearer":
+        raise ValueError(f"Unsupported registry auth scheme: {scheme}")
+
+    params = dict(re.findall(r'(\w+)="([^"]*)"', params))
+    realm = params.pop("realm")
+
+    response = session.get(realm, params=params, timeout=timeout)
+    response.raise_for_status()
+    data = response.json()
+    return data.get("token") or data["access_token"]
+
+
+def registry_get(session, url: str, auth_key: tuple, timeout: int):
+    """GET a registry API URL, negotiating a new bearer token on a 401."""
+    token = _registry_tokens.get(auth_key)
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    response = session.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 401:
+        challenge = response.headers.get("WWW-Authenticate", "")
+        token = _registry_tokens[auth_key] = request_registry_token(session, challenge, timeout)
+        response = session.get(
+            url, headers={"Authorization": f"Bearer {token}"}, timeout=timeout
+        )
+
+    response.raise_for_status()
+    return response
+
+
+def list_registry_tags(session, host: str, repository: str, timeout: int) -> list[str]:
+    """List all tags for a repository through the registry's /v2 API."""
+    tags = []
+    url = f"https://{host}/v2/{repository}/tags/list"
+    while url:
+        response = registry_get(session, url, (host, repository), timeout)
+        tags.extend(response.json().get("tags") or [])
+
+        # Follow pagination links until the last page
+        next_url = response.links.get("next", {}).get("url")
+        url = urljoin(response.url, next_url) if next_url else None
+
+    return tags
+
+
+async def fetch_tags_native(
+    session,
+    stages: list[list[str]],
+    timeout: int = 30,
+) -> list[str] | None:
+    """
+    Replace the skopeo stage of a pipeline with a direct registry API call.
+
+    requests is blocking, so the API calls run in a worker thread. The
+    registry response is reshaped like skopeo's list-tags output and fed to
+    the remaining pipeline stages (usually jq).
+
+    Returns None if the pipeline can't be handled natively or the request fails,
+    so the caller can fall back to skopeo.
+    """
+    source = stages[0]
+    if (
+        len(source) != 3
+        or source[:2] != ["skopeo", "list-tags"]
+        or not source[2].startswith("docker://")
+    ):
+        return None
+
+    registry, host, repository = parse_image_reference(source[2][len("docker://"):])
+
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+        tags = await asyncio.to_thread(
+            list_registry_tags, session, host, repository, timeout
         )
-        if result.returncode != 0:
+    except (requests.RequestException, AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+    if len(stages) == 1:
+        return tags
+
+    listing = json.dumps({"Repository": f"{registry}/{repository}", "Tags": tags})
+    with tempfile.TemporaryFile() as f:
+        f.write(listing.encode())
+        f.seek(0)
+        return await run_pipeline(stages[1:], timeout=timeout, stdin=f)
+
+
+async def run_pipeline(
+    stages: list[list[str]],
+    timeout: int = 30,
+    stdin=None,
+) -> list[str] | None:
+    """
+    Run a pipeline of commands without a shell and return its output lines.
+
+    Returns None if any command in the pipeline fails.
+    """
+    processes = []
+    try:
+        # Don't let the pipeline inherit the terminal
+        if stdin is None:
+            stdin = subprocess.DEVNULL
+
+        for stage in stages[:-1]:
+            read_fd, write_fd = os.pipe()
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *stage,
+                    stdin=stdin,
+                    stdout=write_fd,
+                    stderr=subprocess.DEVNULL,
+                )
+            except BaseException:
+                os.close(read_fd)
+                raise
+            finally:
+                os.close(write_fd)
+                if processes:
+                    os.close(stdin)
+            processes.append(process)
+            stdin = read_fd
+
+        try:
+            last = await asyncio.create_subprocess_exec(
+                *stages[-1],
+                stdin=stdin,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        finally:
+            if processes:
+                # Let the previous stage see SIGPIPE if the last one exits early
+                os.close(stdin)
+        processes.append(last)
+
+        stdout, _ = await asyncio.wait_for(last.communicate(), timeout)
+        for process in processes[:-1]:
+            await asyncio.wait_for(process.wait(), timeout)
+
+        if any(process.returncode != 0 for process in processes):
             return None
 
-        # Split output into lines and filter empty ones
-        tags = [tag.strip() for tag in result.stdout.strip().split("\n") if tag.strip()]
+        # Split the raw output into lines and only decode the non-empty ones
+        tags = []
+        for line in stdout.split(b"\n"):
+            line = line.strip()
+            if line:
+                tags.append(line.decode("utf-8", "replace"))
         return tags
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return None
     except Exception:
         return None
+    finally:
+        for process in processes:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
 
 
+@lru_cache(maxsize=8192)
 def parse_version(tag: str) -> tuple:
     """
     Parse a version string into a tuple for proper sorting.
@@ -100,21 +458,21 @@ def parse_version(tag: str) -> tuple:
     - "8.18.0" -> (8, 18, 0)
     - "RELEASE.2023-12-23T07-19-11Z" -> kept as string (special case)
     """
-    # Remove common prefixes
+    # Remove common prefixes (longest first), matching case-insensitively
     cleaned = tag
+    lowered = tag.lower()
     for prefix in ("version-v", "version-", "v"):
-        if cleaned.lower().startswith(prefix):
-            cleaned = cleaned[len(prefix):]
+        if lowered.startswith(prefix):
+            cleaned = tag[len(prefix):]
             break
 
     # Try to extract version numbers
-    # Match sequences of digits separated by dots, dashes, or underscores
-    version_match = re.match(r"^(\d+(?:[.\-_]\d+)*)", cleaned)
+    version_match = VERSION_RE.match(cleaned)
 
     if version_match:
         version_str = version_match.group(1)
         # Split on common separators and convert to integers
-        parts = re.split(r"[.\-_]", version_str)
+        parts = VERSION_SEPARATOR_RE.split(version_str)
         try:
             return tuple(int(p) for p in parts)
         except ValueError:
@@ -124,26 +482,133 @@ def parse_version(tag: str) -> tuple:
     return (float("inf"), tag)
 
 
-def get_latest_tag(tags: list[str], current_value: str) -> str | None:
+def get_latest_tag(tags: list[str]) -> str | None:
     """
     Determine the latest tag from the list using semantic version sorting.
 
-    Properly sorts version numbers so that 16.11 > 16.9.
+    Properly compares version numbers so that 16.11 > 16.9.
     """
     if not tags:
         return None
 
-    # Sort tags by their parsed version, highest first
-    sorted_tags = sorted(tags, key=parse_version, reverse=True)
-    return sorted_tags[0]
+    # Only the highest parsed version is needed, so skip the full sort
+    return max(tags, key=parse_version)
 
 
-def compare_versions(current: str, latest: str) -> str:
-    """Return a status indicator for the version comparison."""
-    if current == latest:
-        return "up-to-date"
+async def check_image_tag(
+    item: dict,
+    timeout: int,
+    cache: dict | None = None,
+    cache_ttl: int = 0,
+    session=None,
+) -> dict:
+    """
+    Run the skopeo command for a single image tag entry.
+
+    Entries marked "# noupdate" or pinned to a sha256 digest are reported as
+    pinned without running the command.
+
+    Returns the entry extended with latest_value, status and all_tags (the
+    last RECENT_TAG_COUNT tags only).
+    """
+    if item["pinned"] or item["current_value"].startswith("sha256:"):
+        return {
+            **item,
+            "latest_value": item["current_value"],
+            "status": "pinned",
+            "all_tags": [],
+        }
+
+    tags = await run_skopeo_command(
+        item["skopeo_command"],
+        timeout=timeout,
+        cache=cache,
+        cache_ttl=cache_ttl,
+        session=session,
+    )
+
+    if tags is None:
+        return {
+            **item,
+            "latest_value": None,
+            "status": "error",
+            "all_tags": [],
+        }
+
+    latest = get_latest_tag(tags)
+    if latest is None:
+        status = "unknown"
+    elif latest == item["current_value"]:
+        status = "up-to-date"
+    else:
+        status = "update-available"
+
+    return {
+        **item,
+        "latest_value": latest,
+        "status": status,
+        "all_tags": tags[-RECENT_TAG_COUNT:],  # Keep the most recent tags only
+    }
+
+
+def print_progress(result: dict) -> None:
+    """
+    Print a single progress line for a completed check.
+
+    Each line is written in one call. Output is left to the stream's
+    buffering, which flushes every line on a terminal and batches writes
+    when redirected.
+    """
+    status = result["status"]
+    if status == "update-available":
+        label = f"{YELLOW}update available{RESET}"
+    elif status == "up-to-date":
+        label = f"{GREEN}up-to-date{RESET}"
+    elif status == "error":
+        label = f"{RED}failed{RESET}"
+    elif status == "pinned":
+        label = f"{CYAN}pinned{RESET}"
     else:
-        return "update-available"
+        label = f"{RED}unknown{RESET}"
+
+    sys.stdout.write(f"  Checking {CYAN}{result['variable']}{RESET}... {label}\n")
+
+
+async def check_all(
+    image_tags: list[dict],
+    timeout: int,
+    concurrency: int,
+    cache: dict | None = None,
+    cache_ttl: int = 0,
+    session=None,
+) -> list[dict]:
+    """
+    Check all image tag entries concurrently, at most concurrency at a time.
+
+    Progress is printed as each check completes. Results are returned in the
+    same order as image_tags.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def check_one(item: dict) -> dict:
+        # Report unexpected failures as errors; letting them escape gather()
+        # would cancel the other checks mid-spawn and hang the run
+        try:
+            async with semaphore:
+                result = await check_image_tag(
+                    item, timeout, cache=cache, cache_ttl=cache_ttl, session=session
+                )
+        except Exception:
+            result = {
+                **item,
+                "latest_value": None,
+                "status": "error",
+                "all_tags": [],
+            }
+        print_progress(result)
+        return result
+
+    return await asyncio.gather(*(check_one(item) for item in image_tags))
 
 
 def main():
@@ -161,6 +626,29 @@ def main():
         default=30,
         help="Timeout in seconds for each skopeo command (default: 30)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Number of skopeo commands to run in parallel (default: 16)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=900,
+        help="Seconds to reuse tag lists from previous runs (default: 900)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Don't read or write the tag cache at {CACHE_FILE}",
+    )
+    parser.add_argument(
+        "--native-http",
+        action="store_true",
+        help="Query registry APIs directly over shared HTTP connections instead "
+        "of running skopeo (falls back to skopeo on failure; requires requests)",
+    )
     parser.add_argument(
         "--updates-only",
         action="store_true",
@@ -236,99 +724,89 @@ def main():
 
     print(f"{BOLD}Checking {len(image_tags)} image tags...{RESET}\n")
 
-    results = []
-    updates_available = 0
-
-    for item in image_tags:
-        variable = item["variable"]
-        current = item["current_value"]
-        command = item["skopeo_command"]
-
-        # Show progress
-        print(f"  Checking {CYAN}{variable}{RESET}...", end=" ", flush=True)
+    cache = None if args.no_cache else load_tag_cache(CACHE_FILE)
 
-        tags = run_skopeo_command(command, timeout=args.timeout)
-
-        if tags is None:
-            print(f"{RED}failed{RESET}")
-            results.append(
-                {
-                    **item,
-                    "latest_value": None,
-                    "status": "error",
-                    "all_tags": [],
-                }
+    session = None
+    if args.native_http:
+        if requests is None:
+            print(
+                f"{YELLOW}Warning: requests is not installed, using skopeo.{RESET}",
+                file=sys.stderr,
             )
-            continue
+        else:
+            # Reuse connections to each registry across all checks
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=16, pool_maxsize=max(1, args.concurrency)
+            )
+            session.mount("https://", adapter)
+
+    results = asyncio.run(
+        check_all(
+            image_tags,
+            args.timeout,
+            args.concurrency,
+            cache=cache,
+            cache_ttl=args.cache_ttl,
+            session=session,
+        )
+    )
+    sys.stdout.flush()
 
-        latest = get_latest_tag(tags, current)
-        status = compare_versions(current, latest) if latest else "unknown"
+    if session is not None:
+        session.close()
 
-        if status == "update-available":
-            updates_available += 1
-            print(f"{YELLOW}update available{RESET}")
-        elif status == "up-to-date":
-            print(f"{GREEN}up-to-date{RESET}")
-        else:
-            print(f"{RED}unknown{RESET}")
+    if cache is not None:
+        save_tag_cache(CACHE_FILE, cache, args.cache_ttl)
 
-        results.append(
-            {
-                **item,
-                "latest_value": latest,
-                "status": status,
-                "all_tags": tags[-10:] if tags else [],  # Keep last 10 tags
-            }
-        )
+    counts = Counter(r["status"] for r in results)
 
     # Output results
     if args.json:
-        import json
-
         # Filter if updates-only
         if args.updates_only:
             results = [r for r in results if r["status"] == "update-available"]
         print(json.dumps(results, indent=2))
     else:
-        print(f"\n{BOLD}{'=' * 60}{RESET}")
-        print(f"{BOLD}Results:{RESET}\n")
-
-        for r in results:
-            if args.updates_only and r["status"] != "update-available":
-                continue
-
-            variable = r["variable"]
-            current = r["current_value"]
+        # Build the whole report first so it's written out in one go
+        report = io.StringIO()
 
-            if status == "up-to-date" and not args.updates_only:
-                print(f"  {GREEN}✓{RESET} {variable}: {current}")
-                print()
-            elif status == "error" and not args.updates_only:
-                print(f"  {RED}✗{RESET} {variable}: {current} (failed to check)")
-                print()
+        print(f"\n{BOLD}{'=' * 60}{RESET}", file=report)
+        print(f"{BOLD}Results:{RESET}\n", file=report)
 
         for r in results:
-            if args.updates_only and r["status"] != "update-available":
-                continue
-
             variable = r["variable"]
             current = r["current_value"]
-            latest = r["latest_value"]
             status = r["status"]
 
             if status == "update-available":
-                print(f"  {YELLOW}▶{RESET} {BOLD}{variable}{RESET}")
-                print(f"    Current: {current}")
-                print(f"    Latest:  {GREEN}{latest}{RESET}")
-                print()
-
-        print(f"\n{BOLD}Summary:{RESET}")
-        print(f"  Total checked: {len(results)}")
-        print(f"  Up-to-date:    {GREEN}{len([r for r in results if r['status'] == 'up-to-date'])}{RESET}")
-        print(f"  Updates:       {YELLOW}{updates_available}{RESET}")
-        print(f"  Errors:        {RED}{len([r for r in results if r['status'] == 'error'])}{RESET}")
-
-    sys.exit(0 if updates_available == 0 else 1)
+                print(f"  {YELLOW}▶{RESET} {BOLD}{variable}{RESET}", file=report)
+                print(f"    Current: {current}", file=report)
+                print(f"    Latest:  {GREEN}{r['latest_value']}{RESET}", file=report)
+                print(file=report)
+            elif args.updates_only:
+                continue
+            elif status == "up-to-date":
+                print(f"  {GREEN}✓{RESET} {variable}: {current}", file=report)
+                print(file=report)
+            elif status == "error":
+                print(f"  {RED}✗{RESET} {variable}: {current} (failed to check)", file=report)
+                print(file=report)
+            elif status == "pinned":
+                print(f"  {CYAN}•{RESET} {variable}: {current} (pinned)", file=report)
+                print(file=report)
+
+        print(f"\n{BOLD}Summary:{RESET}", file=report)
+        print(f"  Total checked: {len(results)}", file=report)
+        print(f"  Up-to-date:    {GREEN}{counts['up-to-date']}{RESET}", file=report)
+        print(f"  Updates:       {YELLOW}{counts['update-available']}{RESET}", file=report)
+        print(f"  Errors:        {RED}{counts['error']}{RESET}", file=report)
+        print(f"  Pinned:        {CYAN}{counts['pinned']}{RESET}", file=report)
+
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+
+    sys.exit(0 if counts["update-available"] == 0 else 1)
 
 
 if __name__ == "__main__":